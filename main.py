@@ -6,9 +6,14 @@ print("TOKEN =", os.environ.get("TOKEN"))
 import os
 import json
 import re
+import math
+import asyncio
+from collections import defaultdict
+from bisect import bisect_left, bisect_right
 from pathlib import Path
 from datetime import datetime, timedelta, date, timezone
 
+import orjson
 from telegram import Update
 from telegram.ext import (
     ApplicationBuilder, CommandHandler, MessageHandler, ConversationHandler,
@@ -20,49 +25,286 @@ import os
 print("TOKEN" in os.environ)
 print(os.environ.get("TOKEN"))
 SAVE_FILE = Path("deals.json")
+FLUSH_DELAY = 2.0  # секунды между изменением и записью на диск
 DATE, NAME, AMOUNT, FEE, RATE, MEMBERS = range(6)
+_DATE_RE = re.compile(r"(\d{1,2})[./](\d{1,2})")
+_MEMBER_RE = re.compile(r"#\d+")
+_TODAY = frozenset({"сегодня", "today"})
+# Деньги хранятся целыми: копейки/центы, комиссия в сотых долях процента, курс ×10⁴
+RUB_SCALE, FEE_SCALE, RATE_SCALE, USD_SCALE = 100, 100, 10000, 100
+# orjson кодирует только 64-битные целые
+INT_LIMIT = 2 ** 63
+# Старые float-поля и их целочисленные замены с масштабом
+_LEGACY_MONEY = (
+    ("rub", "rub_kop", RUB_SCALE),
+    ("fee", "fee_bp", FEE_SCALE),
+    ("rate", "rate_e4", RATE_SCALE),
+    ("clean_rub", "clean_rub_kop", RUB_SCALE),
+    ("usd", "usd_cents", USD_SCALE),
+    ("pool", "pool_cents", USD_SCALE),
+    ("share", "share_cents", USD_SCALE),
+)
 
 # ─── HELPERS ───
-def load_deals():
-    if not SAVE_FILE.exists():
-        return []
+# Кэш сделок: файл перечитывается только если изменились mtime или размер
+_DEALS_CACHE = {"mtime": None, "size": None, "data": None}
+# Индекс по дате: _DATES отсортирован, _DEALS_SORTED выровнен с ним
+_DATES = []
+_DEALS_SORTED = []
+# Сделки, сгруппированные по дню: date -> [deal, ...]
+_BY_DATE = defaultdict(list)
+# Отложенная запись: dirty — в памяти есть несохранённые изменения
+# writing — идёт запись в фоновом потоке, task — сама задача записи
+_FLUSH_STATE = {"dirty": False, "writing": False, "handle": None, "task": None}
+
+def _enrich(deal):
+    # Служебные поля с "_" вычисляются при загрузке и не сохраняются в файл
+    deal["_date"] = date.fromisoformat(deal["date_iso"][:10])
+    deal["_day_str"] = deal["_date"].strftime("%d.%m")
+    # Старые записи без готовой строки участников дополняем при загрузке
+    if "members_str" not in deal:
+        deal["members_str"] = ', '.join(deal["members"])
+        deal["members_count"] = len(deal["members"])
+    # Старые записи с float-суммами переводим в целые при загрузке
+    # NaN/Infinity и значения вне 64 бит сохранить целым нельзя — такие суммы обнуляем
+    for old, new, scale in _LEGACY_MONEY:
+        if old in deal:
+            value = deal.pop(old)
+            try:
+                value = value * scale
+            except TypeError:
+                value = None
+            if value is None or not math.isfinite(value) or not _fits_int(round(value)):
+                print(f"⚠️ Сделка {deal['date_iso']} #{deal.get('index')}: некорректное поле {old}, записано 0")
+                value = 0
+            deal[new] = round(value)
+    return deal
+
+def _fits_int(value: int) -> bool:
+    return -INT_LIMIT < value < INT_LIMIT
+
+def _div_round(a: int, b: int) -> int:
+    return (2 * a + b) // (2 * b)
+
+def parse_scaled(txt: str, scale: int) -> int:
+    value = float(txt.replace(",", ".")) * scale
+    if not math.isfinite(value) or not _fits_int(round(value)):
+        raise ValueError(txt)
+    return round(value)
+
+def _build_index(data):
+    # Строит новые структуры индекса, не трогая глобальные
+    deals_sorted = sorted(data, key=lambda d: d["_date"])
+    by_date = defaultdict(list)
+    for d in deals_sorted:
+        by_date[d["_date"]].append(d)
+    return deals_sorted, [d["_date"] for d in deals_sorted], by_date
+
+def _install_index(index):
+    deals_sorted, dates, by_date = index
+    _DEALS_SORTED[:] = deals_sorted
+    _DATES[:] = dates
+    _BY_DATE.clear()
+    _BY_DATE.update(by_date)
+
+def _rebuild_index(data):
+    _install_index(_build_index(data))
+
+def _file_stamp():
     try:
-        return json.loads(SAVE_FILE.read_text(encoding="utf-8"))
-    except Exception:
-        return []
+        st = SAVE_FILE.stat()
+    except FileNotFoundError:
+        return None, None
+    return st.st_mtime_ns, st.st_size
+
+def _cached_deals():
+    # Актуальный кэш или None, если файл нужно перечитать
+    if _FLUSH_STATE["dirty"] or _FLUSH_STATE["writing"]:
+        return _DEALS_CACHE["data"]
+    mtime, size = _file_stamp()
+    if (
+        _DEALS_CACHE["data"] is not None
+        and _DEALS_CACHE["mtime"] == mtime
+        and _DEALS_CACHE["size"] == size
+    ):
+        return _DEALS_CACHE["data"]
+    return None
+
+def _read_deals_file():
+    # Читает и разбирает файл; глобальное состояние не меняет, поэтому безопасна в потоке
+    mtime, size = _file_stamp()
+    if mtime is None:
+        data = []
+    else:
+        try:
+            data = orjson.loads(SAVE_FILE.read_bytes())
+        except orjson.JSONDecodeError:
+            # Старый json.dumps мог записать NaN/Infinity, которые orjson не читает
+            try:
+                data = json.loads(SAVE_FILE.read_text(encoding="utf-8"))
+            except Exception:
+                data = []
+        except Exception:
+            data = []
+    for d in data:
+        _enrich(d)
+    return data, _build_index(data), mtime, size
+
+def _install_deals(data, index, mtime, size):
+    _install_index(index)
+    _DEALS_CACHE.update(mtime=mtime, size=size, data=data)
+    return data
+
+def load_deals():
+    data = _cached_deals()
+    if data is not None:
+        return data
+    return _install_deals(*_read_deals_file())
+
+async def aload_deals():
+    # Попадание в кэш обслуживается в цикле событий. В потоке файл только читается
+    # и разбирается, а подмена кэша и индекса происходит уже в цикле событий.
+    data = _cached_deals()
+    if data is not None:
+        return data
+    loaded = await asyncio.to_thread(_read_deals_file)
+    data = _cached_deals()
+    if data is not None:
+        return data
+    return _install_deals(*loaded)
+
+def _encode_deals(deals):
+    plain = [{k: v for k, v in d.items() if not k.startswith("_")} for d in deals]
+    return orjson.dumps(plain, option=orjson.OPT_INDENT_2)
+
+def _write_deals_file(payload):
+    # Пишем во временный файл и подменяем атомарно, чтобы не оставить обрезанный JSON
+    tmp = SAVE_FILE.with_suffix(".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, SAVE_FILE)
+    return _file_stamp()
 
 def save_deals(deals):
-    SAVE_FILE.write_text(json.dumps(deals, indent=2, ensure_ascii=False), encoding="utf-8")
+    mtime, size = _write_deals_file(_encode_deals(deals))
+    if deals is not _DEALS_CACHE["data"]:
+        _rebuild_index(deals)
+    _DEALS_CACHE.update(mtime=mtime, size=size, data=deals)
+
+async def _flush_in_thread():
+    # Снимок кодируется в цикле событий, на диск пишет отдельный поток.
+    # Пока идёт запись, новые изменения подхватываются следующим витком цикла.
+    failed = False
+    _FLUSH_STATE["writing"] = True
+    try:
+        while _FLUSH_STATE["dirty"]:
+            _FLUSH_STATE["dirty"] = False
+            try:
+                payload = _encode_deals(_DEALS_CACHE["data"])
+                mtime, size = await asyncio.to_thread(_write_deals_file, payload)
+            except Exception as e:
+                _FLUSH_STATE["dirty"] = True
+                failed = True
+                print(f"❌ Не удалось сохранить {SAVE_FILE}: {e}")
+                break
+            if not _FLUSH_STATE["dirty"]:
+                _DEALS_CACHE.update(mtime=mtime, size=size)
+    finally:
+        _FLUSH_STATE["writing"] = False
+        _FLUSH_STATE["task"] = None
+    if failed and _FLUSH_STATE["handle"] is None:
+        _FLUSH_STATE["handle"] = asyncio.get_running_loop().call_later(FLUSH_DELAY, _start_flush)
+
+def _start_flush():
+    _FLUSH_STATE["handle"] = None
+    if _FLUSH_STATE["task"] is not None:
+        # Текущая запись сама допишет новые изменения
+        return
+    _FLUSH_STATE["task"] = asyncio.get_running_loop().create_task(_flush_in_thread())
+
+def flush_deals():
+    handle = _FLUSH_STATE["handle"]
+    if handle is not None:
+        handle.cancel()
+        _FLUSH_STATE["handle"] = None
+    if _FLUSH_STATE["dirty"]:
+        save_deals(_DEALS_CACHE["data"])
+        _FLUSH_STATE["dirty"] = False
+
+def schedule_flush():
+    _FLUSH_STATE["dirty"] = True
+    if _FLUSH_STATE["handle"] is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        flush_deals()
+        return
+    _FLUSH_STATE["handle"] = loop.call_later(FLUSH_DELAY, _start_flush)
 
-def parse_date(txt: str) -> date | None:
+def add_deal(deal):
+    deals = load_deals()
+    deals.append(deal)
+    pos = bisect_right(_DATES, deal["_date"])
+    _DATES.insert(pos, deal["_date"])
+    _DEALS_SORTED.insert(pos, deal)
+    _BY_DATE[deal["_date"]].append(deal)
+    schedule_flush()
+
+def remove_deal(deal):
+    # deal взят из индекса, значит кэш уже загружен
+    deals = _DEALS_CACHE["data"]
+    pos = next((i for i, d in enumerate(deals) if d is deal), None)
+    if pos is None:
+        return
+    del deals[pos]
+    lo = bisect_left(_DATES, deal["_date"])
+    hi = bisect_right(_DATES, deal["_date"], lo=lo)
+    for pos in range(lo, hi):
+        if _DEALS_SORTED[pos] is deal:
+            del _DATES[pos], _DEALS_SORTED[pos]
+            break
+    bucket = _BY_DATE[deal["_date"]]
+    del bucket[next(i for i, d in enumerate(bucket) if d is deal)]
+    if not bucket:
+        del _BY_DATE[deal["_date"]]
+    schedule_flush()
+
+def _today_utc() -> date:
+    return datetime.now(timezone.utc).date()
+
+def parse_date(txt: str, today: date | None = None) -> date | None:
+    if today is None:
+        today = _today_utc()
     txt = txt.strip().lower()
-    if txt in {"сегодня", "today"}:
-        return datetime.now(timezone.utc).date()
-    match = re.match(r"(\d{1,2})[./](\d{1,2})", txt)
+    if txt in _TODAY:
+        return today
+    match = _DATE_RE.match(txt)
     if not match:
         return None
     day, month = map(int, match.groups())
     try:
-        return date(datetime.now().year, month, day)
+        return date(today.year, month, day)
     except ValueError:
         return None
 
 def tuesday_week_range(ref: date | None = None):
     if ref is None:
-        ref = datetime.now(timezone.utc).date()
+        ref = _today_utc()
     offset = (ref.weekday() - 1) % 7  # Tuesday is 1
     start = ref - timedelta(days=offset)
     return start, start + timedelta(days=6)
 
+# Выборки читают индекс; перед ними вызывающий код делает load_deals()
 def filter_deals_by_date_range(start: date, end: date):
-    return [
-        d for d in load_deals()
-        if start <= datetime.fromisoformat(d['date_iso']).date() <= end
-    ]
+    lo = bisect_left(_DATES, start)
+    hi = bisect_right(_DATES, end, lo=lo)
+    return _DEALS_SORTED[lo:hi]
+
+def deals_for_date(d: date):
+    return _BY_DATE.get(d, [])
 
-def get_next_index_for_date(deals, d: date):
-    same_day = [deal for deal in deals if datetime.fromisoformat(deal['date_iso']).date() == d]
-    return len(same_day) + 1
+def get_next_index_for_date(d: date):
+    return len(_BY_DATE.get(d, ())) + 1
 
 # ─── WORKFLOW ───
 async def start_deal(update: Update, context: ContextTypes.DEFAULT_TYPE):
@@ -85,7 +327,7 @@ async def get_name(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def get_amount(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
-        context.user_data["amount"] = float(update.message.text.replace(",", "."))
+        context.user_data["amount"] = parse_scaled(update.message.text, RUB_SCALE)
     except ValueError:
         await update.message.reply_text("⚠️ Введите число.")
         return AMOUNT
@@ -94,7 +336,7 @@ async def get_amount(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def get_fee(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
-        context.user_data["fee"] = float(update.message.text.replace(",", "."))
+        context.user_data["fee"] = parse_scaled(update.message.text, FEE_SCALE)
     except ValueError:
         await update.message.reply_text("⚠️ Введите число.")
         return FEE
@@ -103,7 +345,10 @@ async def get_fee(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def get_rate(update: Update, context: ContextTypes.DEFAULT_TYPE):
     try:
-        context.user_data["rate"] = float(update.message.text.replace(",", "."))
+        rate = parse_scaled(update.message.text, RATE_SCALE)
+        if rate <= 0:
+            raise ValueError(update.message.text)
+        context.user_data["rate"] = rate
     except ValueError:
         await update.message.reply_text("⚠️ Неверный курс")
         return RATE
@@ -113,7 +358,7 @@ async def get_rate(update: Update, context: ContextTypes.DEFAULT_TYPE):
 
 async def get_members(update: Update, context: ContextTypes.DEFAULT_TYPE):
     raw = update.message.text.strip()
-    members = re.findall(r"#\d+", raw)
+    members = _MEMBER_RE.findall(raw)
     if not members:
         await update.message.reply_text("⚠️ Укажите хотя бы одного участника через #")
         return MEMBERS
@@ -123,74 +368,90 @@ async def get_members(update: Update, context: ContextTypes.DEFAULT_TYPE):
     fee = context.user_data["fee"]
     rate = context.user_data["rate"]
 
-    clean_rub = rub - (rub * fee / 100)
-    usd = clean_rub / rate
-    pool = usd * 0.25
-    share = pool / total
+    clean_rub = rub - _div_round(rub * fee, 100 * FEE_SCALE)
+    usd = _div_round(clean_rub * USD_SCALE * RATE_SCALE, RUB_SCALE * rate)
+    pool = _div_round(usd, 4)
+    share = _div_round(usd, 4 * total)
+    if not all(_fits_int(v) for v in (clean_rub, usd)):
+        await update.message.reply_text("⚠️ Слишком большие суммы, начните заново: /deal")
+        return ConversationHandler.END
 
     d = context.user_data["date"]
-    deals = load_deals()
-    idx = get_next_index_for_date(deals, d)
+    await aload_deals()
+    idx = get_next_index_for_date(d)
 
     new_deal = {
         "date_iso": d.isoformat(),
         "index": idx,
         "name": context.user_data["name"],
-        "rub": rub,
-        "fee": fee,
-        "rate": rate,
-        "clean_rub": clean_rub,
-        "usd": usd,
-        "pool": pool,
-        "share": share,
-        "members": members
+        "rub_kop": rub,
+        "fee_bp": fee,
+        "rate_e4": rate,
+        "clean_rub_kop": clean_rub,
+        "usd_cents": usd,
+        "pool_cents": pool,
+        "share_cents": share,
+        "members": members,
+        "members_str": ', '.join(members),
+        "members_count": total,
     }
-
-    deals.append(new_deal)
-    save_deals(deals)
+    _enrich(new_deal)
+    add_deal(new_deal)
 
     await update.message.reply_text(
         f"✅ Депозит сохранён\n\n"
         f"📅 {d.strftime('%d.%m')} | {context.user_data['name']}\n"
-        f"💰 {rub:.0f} ₽ → {clean_rub:.0f} ₽ после комиссии ({fee:.1f}%)\n"
-        f"💱 {usd:.2f} $ @ {rate:.2f}, пул 25% = {pool:.2f} $\n"
-        f"👥 Участников: {total}, твоя доля: {share:.2f} $"
+        f"💰 {rub / RUB_SCALE:.0f} ₽ → {clean_rub / RUB_SCALE:.0f} ₽ после комиссии ({fee / FEE_SCALE:.1f}%)\n"
+        f"💱 {usd / USD_SCALE:.2f} $ @ {rate / RATE_SCALE:.2f}, пул 25% = {pool / USD_SCALE:.2f} $\n"
+        f"👥 Участников: {total}, твоя доля: {share / USD_SCALE:.2f} $"
     )
     return ConversationHandler.END
 
 # ─── REPORTS ───
 async def show_report(update, context, start, end, label="Отчёт"):
+    await aload_deals()
     deals = filter_deals_by_date_range(start, end)
     if not deals:
         await update.message.reply_text("Нет депозитов в выбранный период")
         return
-    total = sum(d['share'] for d in deals)
-    lines = []
+    # Один проход: сумма долей и текст собираются вместе
+    total = 0
+    parts = []
+    append = parts.append
     for d in deals:
-        day = datetime.fromisoformat(d["date_iso"]).strftime("%d.%m")
-        members_str = ', '.join(d['members'])
-        lines.append(
-            f"📅 {day} | {d['name']} #{d['index']}\n"
-            f"💰 {d['rub']:.0f} ₽ → {d['clean_rub']:.0f} ₽ после комиссии ({d['fee']:.1f}%)\n"
-            f"💱 {d['usd']:.2f} $ @ {d['rate']:.2f}, пул 25% = {d['pool']:.2f} $\n"
-            f"👥 Участники: {len(d['members'])} ({members_str})\n"
-            f"→ твоя доля: {d['share']:.2f} $\n"
+        share = d['share_cents']
+        total += share
+        append(
+            f"📅 {d['_day_str']} | {d['name']} #{d['index']}\n"
+            f"💰 {d['rub_kop'] / RUB_SCALE:.0f} ₽ → {d['clean_rub_kop'] / RUB_SCALE:.0f} ₽ после комиссии ({d['fee_bp'] / FEE_SCALE:.1f}%)\n"
+            f"💱 {d['usd_cents'] / USD_SCALE:.2f} $ @ {d['rate_e4'] / RATE_SCALE:.2f}, пул 25% = {d['pool_cents'] / USD_SCALE:.2f} $\n"
+            f"👥 Участники: {d['members_count']} ({d['members_str']})\n"
+            f"→ твоя доля: {share / USD_SCALE:.2f} $\n"
         )
     await update.message.reply_text(
-        f"📊 {label}\nВсего: {total:.2f} $\n\n" + "\n".join(lines)
+        f"📊 {label}\nВсего: {total / USD_SCALE:.2f} $\n\n" + "\n".join(parts)
     )
 
 async def show_range(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(context.args) != 2:
         await update.message.reply_text("Формат: /report DD.MM DD.MM")
         return
-    d1 = parse_date(context.args[0])
-    d2 = parse_date(context.args[1])
+    today = _today_utc()
+    d1 = parse_date(context.args[0], today)
+    d2 = parse_date(context.args[1], today)
     if not d1 or not d2:
         await update.message.reply_text("Неверные даты")
         return
     await show_report(update, context, d1, d2, label=f"{d1:%d.%m}–{d2:%d.%m}")
 
+def _format_day_deal(d_):
+    return (
+        f"#{d_['index']} • {d_['name']}, {d_['rub_kop'] / RUB_SCALE:.0f} ₽ → {d_['clean_rub_kop'] / RUB_SCALE:.0f} ₽ после комиссии ({d_['fee_bp'] / FEE_SCALE:.1f}%)\n"
+        f"💱 {d_['usd_cents'] / USD_SCALE:.2f} $ @ {d_['rate_e4'] / RATE_SCALE:.2f}, пул 25% = {d_['pool_cents'] / USD_SCALE:.2f} $\n"
+        f"👥 Участники: {d_['members_count']} ({d_['members_str']})\n"
+        f"→ твоя доля: {d_['share_cents'] / USD_SCALE:.2f} $"
+    )
+
 async def show_by_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not context.args:
         await update.message.reply_text("Формат: /bydate DD.MM")
@@ -199,20 +460,12 @@ async def show_by_date(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if not d:
         await update.message.reply_text("Неверная дата")
         return
-    deals = [d_ for d_ in load_deals() if datetime.fromisoformat(d_["date_iso"]).date() == d]
+    await aload_deals()
+    deals = deals_for_date(d)
     if not deals:
         await update.message.reply_text("Нет депозитов на эту дату")
         return
-    lines = []
-    for d_ in deals:
-        members_str = ', '.join(d_['members'])
-        lines.append(
-            f"#{d_['index']} • {d_['name']}, {d_['rub']:.0f} ₽ → {d_['clean_rub']:.0f} ₽ после комиссии ({d_['fee']:.1f}%)\n"
-            f"💱 {d_['usd']:.2f} $ @ {d_['rate']:.2f}, пул 25% = {d_['pool']:.2f} $\n"
-            f"👥 Участники: {len(d_['members'])} ({members_str})\n"
-            f"→ твоя доля: {d_['share']:.2f} $"
-        )
-    await update.message.reply_text('\n\n'.join(lines))
+    await update.message.reply_text('\n\n'.join(_format_day_deal(d_) for d_ in deals))
 
 async def delete_deal(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if len(context.args) != 2:
@@ -227,17 +480,12 @@ async def delete_deal(update: Update, context: ContextTypes.DEFAULT_TYPE):
     except:
         await update.message.reply_text("Номер должен быть числом")
         return
-    deals = load_deals()
-    filtered = [
-        (i, d_) for i, d_ in enumerate(deals)
-        if datetime.fromisoformat(d_["date_iso"]).date() == d and d_["index"] == num
-    ]
-    if not filtered:
+    await aload_deals()
+    deal = next((d_ for d_ in deals_for_date(d) if d_["index"] == num), None)
+    if deal is None:
         await update.message.reply_text("Не найдено")
         return
-    i, _ = filtered[0]
-    del deals[i]
-    save_deals(deals)
+    remove_deal(deal)
     await update.message.reply_text("✅ Удалено")
 
     
@@ -263,7 +511,7 @@ async def show_week(update: Update, context: ContextTypes.DEFAULT_TYPE):
 async def show_month(update: Update, context: ContextTypes.DEFAULT_TYPE):
     if context.args and context.args[0].isdigit():
         month = int(context.args[0])
-        year = datetime.now(timezone.utc).year
+        year = _today_utc().year
         start = date(year, month, 1)
         if month == 12:
             end = date(year, 12, 31)
@@ -274,13 +522,25 @@ async def show_month(update: Update, context: ContextTypes.DEFAULT_TYPE):
         await update.message.reply_text("Формат: /month MM (например, /month 07)")
 
 # ─── MAIN ───
+async def on_shutdown(app):
+    task = _FLUSH_STATE["task"]
+    if task is not None:
+        try:
+            await task
+        except Exception as e:
+            print(f"❌ Фоновая запись {SAVE_FILE} завершилась ошибкой: {e}")
+    try:
+        flush_deals()
+    except Exception as e:
+        print(f"❌ Не удалось сохранить {SAVE_FILE} при остановке: {e}")
+
 def main():
     TOKEN = os.environ.get("TOKEN")
     if not TOKEN:
         print("❌ Переменная окружения 'TOKEN' не найдена!")
         return
 
-    app = ApplicationBuilder().token(TOKEN).build()
+    app = ApplicationBuilder().token(TOKEN).post_shutdown(on_shutdown).build()
 
     conv = ConversationHandler(
         entry_points=[CommandHandler("deal", start_deal)],